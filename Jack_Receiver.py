@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Receives audio from a JACK input port and passes it through with gain.
+
+The realtime callback multiplies straight into the output port buffer
+and pushes the samples into a lock-free ring buffer; printing and
+analysis happen outside the callback.
+"""
+
+import math
+
+import numpy as np
+import jack
+import matplotlib.pyplot as plt
+
+
+class AudioReceiver:
+
+    def __init__(self, gain=1.0, client_name='audio_receiver'):
+        self.client = jack.Client(client_name)
+        self.gain = gain
+        self.input_port = self.client.inports.register('input')
+        self.output_port = self.client.outports.register('output')
+        # analysis samples leave the callback through a lock-free ring
+        self._ring = jack.RingBuffer(self.client.samplerate * 4 * 4)
+        # running sums for RMS; updated allocation-free in the callback
+        self._ss = 0.0
+        self._n = 0
+        self.client.set_process_callback(self.process_audio)
+
+    def process_audio(self, frames):
+        input_data = self.input_port.get_array()
+        np.multiply(input_data, self.gain, out=self.output_port.get_array())
+        self._ss += float(np.dot(input_data, input_data))
+        self._n += input_data.size
+        self._ring.write(input_data)
+
+    def read_buffer(self):
+        """Drain the analysis ring into a float32 array."""
+        data = self._ring.read(self._ring.read_space)
+        return np.frombuffer(data, dtype=np.float32)
+
+    def rms(self):
+        """RMS since the last call, from the callback's running sums."""
+        if self._n == 0:
+            return 0.0
+        value = math.sqrt(self._ss / self._n)
+        self._ss = 0.0
+        self._n = 0
+        return value
+
+    def plot_buffer(self):
+        """Plot the drained samples, scope style."""
+        data = self.read_buffer()
+        plt.plot(data)
+        plt.xlabel('sample')
+        plt.ylabel('amplitude')
+        plt.show()
+
+    def start(self):
+        self.client.activate()
+        self.client.connect('system:capture_1', self.input_port)
+        self.client.connect(self.output_port, 'system:playback_1')
+
+    def stop(self):
+        self.client.deactivate()
+        self.client.close()
+
+
+if __name__ == '__main__':
+    receiver = AudioReceiver(gain=1.0)
+    receiver.start()
+    input('Receiving, press enter to stop\n')
+    print('rms:', receiver.rms())
+    receiver.stop()
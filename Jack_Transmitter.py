@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Sends a test tone out of a JACK output port.
+
+The tone is generated with a wrapped phase accumulator and a
+7th-degree polynomial approximation of sin, so the realtime callback
+never calls a transcendental per sample and the sin argument never
+grows.
+"""
+
+import math
+
+import numpy as np
+import jack
+
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def _make_kernel(blocksize):
+    """JIT a sine kernel specialized to this client's fixed block size."""
+    def kernel(out, amplitude, phase, dphase):
+        for i in numba.prange(blocksize):
+            out[i] = amplitude * math.sin(phase + i * dphase)
+    return numba.njit(parallel=True, fastmath=True)(kernel)
+
+
+class AudioSender:
+
+    # odd minimax polynomial for sin(x) on [-pi/2, pi/2] (error ~6e-7):
+    # sin(x) ~ x*(C1 + C3*x^2 + C5*x^4 + C7*x^6); the callback folds the
+    # phase into that quarter-cycle range before evaluating it
+    _C1 = 0.9999966
+    _C3 = -0.16664824
+    _C5 = 0.00830629
+    _C7 = -0.00018363
+
+    def __init__(self, frequency=440.0, amplitude=0.5, client_name='audio_sender'):
+        self.client = jack.Client(client_name)
+        self.sample_rate = self.client.samplerate
+        self.amplitude = amplitude
+        self.phase = 0.0
+        self.set_frequency(frequency)
+        self.output_port = self.client.outports.register('output')
+        # float32 scratch for the NumPy path: no astype copy per block
+        self._ramp = np.arange(self.client.blocksize, dtype=np.float32)
+        self._scratch = np.empty(self.client.blocksize, dtype=np.float32)
+        self._x2 = np.empty(self.client.blocksize, dtype=np.float32)
+        self._poly = np.empty(self.client.blocksize, dtype=np.float32)
+        # compile ahead of activation so the first callback pays no JIT cost
+        self._kernel = _make_kernel(self.client.blocksize) if HAVE_NUMBA else None
+        if self._kernel is not None:
+            self._kernel(np.empty(self.client.blocksize, dtype=np.float32),
+                         0.0, 0.0, 0.0)
+        self.client.set_process_callback(self.process_audio)
+
+    def set_frequency(self, frequency):
+        """Change the tone frequency and the per-sample phase step."""
+        self.frequency = frequency
+        # phase is kept in cycles, wrapped to [0, 1), so the sin argument
+        # never grows past one period no matter how long the client runs
+        self.dphase = frequency / self.sample_rate
+
+    def process_audio(self, frames):
+        if self._kernel is not None:
+            self._kernel(self.output_port.get_array(), self.amplitude,
+                         2 * np.pi * self.phase, 2 * np.pi * self.dphase)
+            self.phase = (self.phase + frames * self.dphase) % 1.0
+            return
+        scratch = self._scratch[:frames]
+        np.multiply(self._ramp[:frames], np.float32(self.dphase), out=scratch)
+        scratch += np.float32(self.phase)
+        scratch -= np.rint(scratch)  # wrap to [-0.5, 0.5); sin is 1-periodic
+        # quadrant fold: sin(2*pi*u) = sin(2*pi*copysign(0.25 - ||u|-0.25|, u)),
+        # which maps the argument into [-pi/2, pi/2] where the fit holds
+        fold = self._x2[:frames]  # borrowed as a temp before it holds x^2
+        np.abs(scratch, out=fold)
+        fold -= np.float32(0.25)
+        np.abs(fold, out=fold)
+        np.subtract(np.float32(0.25), fold, out=fold)
+        np.copysign(fold, scratch, out=scratch)
+        scratch *= np.float32(2 * np.pi)
+        # Horner evaluation of the sine polynomial, all in-place
+        x2 = self._x2[:frames]
+        np.multiply(scratch, scratch, out=x2)
+        p = self._poly[:frames]
+        np.multiply(x2, np.float32(self._C7), out=p)
+        p += np.float32(self._C5)
+        p *= x2
+        p += np.float32(self._C3)
+        p *= x2
+        p += np.float32(self._C1)
+        p *= scratch
+        p *= np.float32(self.amplitude)
+        np.copyto(self.output_port.get_array(), p)
+        self.phase = (self.phase + frames * self.dphase) % 1.0
+
+    def start(self):
+        self.client.activate()
+        self.client.connect(self.output_port, 'system:playback_1')
+
+    def stop(self):
+        self.client.deactivate()
+        self.client.close()
+
+
+if __name__ == '__main__':
+    sender = AudioSender(frequency=440.0)
+    sender.start()
+    input('Sending tone, press enter to stop\n')
+    sender.stop()
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+Reads a WAV file and decodes the samples into a NumPy array.
+
+Decoding goes through libsndfile, which handles the sample width and
+channel count itself -- including the PCM_24 files jack_record writes,
+which a hardcoded int16 decode would corrupt.
+"""
+
+import sys
+
+import numpy as np
+import soundfile as sf
+
+DEBUG_PRINT = False
+
+
+def read_samples(path, dtype='float32'):
+    """Return (samples, samplerate) for a WAV file of any PCM subtype."""
+    data, samplerate = sf.read(path, dtype=dtype)
+    return data, samplerate
+
+
+if __name__ == '__main__':
+    samples, samplerate = read_samples('sine.wav')
+    if DEBUG_PRINT:
+        np.savetxt(sys.stdout, samples, fmt='%g')
+    print(samples)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Plays a WAV file through JACK.
+
+Channels are stored as separate contiguous float32 arrays, so the
+realtime callback copies a flat slice per channel instead of gathering
+a strided column out of an interleaved (frames, channels) array.
+"""
+
+import numpy as np
+import jack
+import soundfile as sf
+
+
+class JackWavPlayer:
+
+    def __init__(self, wav_path=None, client_name='wav_player'):
+        self.client = jack.Client(client_name)
+        self.channels = 0
+        self.channels_data = []
+        self.position = 0
+        self.playing = False
+        self.output_ports = [
+            self.client.outports.register('out_1'),
+            self.client.outports.register('out_2'),
+        ]
+        self._out_arrays = None
+        self.client.set_process_callback(self.process_callback)
+        if wav_path is not None:
+            self.load_wav(wav_path)
+
+    def load_wav(self, path):
+        """Load a WAV file and split it into per-channel arrays."""
+        audio_data, self.samplerate = sf.read(path, dtype='float32')
+        if audio_data.ndim == 1:
+            audio_data = audio_data[:, np.newaxis]
+        self.channels = audio_data.shape[1]
+        self.channels_data = [np.ascontiguousarray(audio_data[:, c])
+                              for c in range(self.channels)]
+        self.position = 0
+
+    def process_callback(self, frames):
+        if self._out_arrays is None:
+            # the port buffers are stable across blocks once activated
+            self._out_arrays = [p.get_array() for p in self.output_ports]
+        if not self.playing or not self.channels_data:
+            for output_buffer in self._out_arrays:
+                output_buffer[:] = 0
+            return
+        total_frames = len(self.channels_data[0])
+        frames_to_play = min(frames, total_frames - self.position)
+        for ch, output_buffer in enumerate(self._out_arrays):
+            data = self.channels_data[ch if ch < self.channels else -1]
+            output_buffer[:frames_to_play] = \
+                data[self.position:self.position + frames_to_play]
+            output_buffer[frames_to_play:] = 0
+        self.position += frames_to_play
+        if self.position >= total_frames:
+            self.playing = False
+
+    def start(self):
+        self.client.activate()
+        for port, target in zip(self.output_ports,
+                                ('system:playback_1', 'system:playback_2')):
+            self.client.connect(port, target)
+
+    def play(self):
+        self.position = 0
+        self.playing = True
+
+    def stop(self):
+        self.playing = False
+        self.client.deactivate()
+        self.client.close()
+
+
+if __name__ == '__main__':
+    player = JackWavPlayer('sine.wav')
+    player.start()
+    player.play()
+    input('Playing, press enter to stop\n')
+    player.stop()
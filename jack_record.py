@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Records JACK input ports to a WAV file.
+
+Blocks are handed from the realtime callback to the writer thread
+through a lock-free jack.RingBuffer, so the callback never touches a
+lock or waits on file I/O.
+"""
+
+import threading
+
+import numpy as np
+import jack
+import soundfile as sf
+
+
+class JackAudioSink:
+
+    def __init__(self, output_path='recording.wav', channels=2,
+                 client_name='audio_sink'):
+        self.client = jack.Client(client_name)
+        self.sample_rate = self.client.samplerate
+        self.channels = channels
+        self.input_ports = [self.client.inports.register('input_%d' % (i + 1))
+                            for i in range(channels)]
+        # four seconds of float32 frames; written lock-free from the callback
+        self._rb = jack.RingBuffer(self.sample_rate * self.channels * 4 * 4)
+        # reusable staging block so the callback never allocates
+        self._stage = np.empty((self.client.blocksize, self.channels),
+                               dtype=np.float32)
+        # batch ~100 ms of frames per file write to amortize syscalls
+        self._batch_frames = max(self.sample_rate // 10, self.client.blocksize)
+        self._batch = np.empty((self._batch_frames, self.channels),
+                               dtype=np.float32)
+        self._batch_fill = 0
+        self._data_ready = threading.Event()
+        self.should_stop = threading.Event()
+        self.output_file = sf.SoundFile(output_path, mode='w',
+                                        samplerate=self.sample_rate,
+                                        channels=channels, subtype='PCM_24')
+        self.write_thread = threading.Thread(target=self.write_worker,
+                                             daemon=True)
+        self.client.set_process_callback(self.process_callback)
+
+    def process_callback(self, frames):
+        stage = self._stage[:frames]
+        for c, port in enumerate(self.input_ports):
+            np.copyto(stage[:, c], port.get_array())
+        self._rb.write(stage)
+        self._data_ready.set()
+
+    def write_worker(self):
+        """Drain the ring buffer into the output file in ~100 ms batches."""
+        frame_bytes = 4 * self.channels
+        while not self.should_stop.is_set():
+            self._data_ready.wait(timeout=0.1)
+            self._data_ready.clear()
+            self._drain(frame_bytes)
+        self._drain(frame_bytes)
+        if self._batch_fill:
+            self.output_file.write(self._batch[:self._batch_fill])
+            self._batch_fill = 0
+
+    def _drain(self, frame_bytes):
+        available = self._rb.read_space
+        available -= available % frame_bytes
+        if not available:
+            return
+        data = self._rb.read(available)
+        block = np.frombuffer(data, dtype=np.float32).reshape(-1, self.channels)
+        pos = 0
+        while pos < len(block):
+            n = min(len(block) - pos, self._batch_frames - self._batch_fill)
+            np.copyto(self._batch[self._batch_fill:self._batch_fill + n],
+                      block[pos:pos + n])
+            self._batch_fill += n
+            pos += n
+            if self._batch_fill == self._batch_frames:
+                self.output_file.write(self._batch)
+                self._batch_fill = 0
+
+    def start(self):
+        self.client.activate()
+        for i, port in enumerate(self.input_ports):
+            self.client.connect('system:capture_%d' % (i + 1), port)
+        self.write_thread.start()
+
+    def stop(self):
+        self.client.deactivate()
+        self.should_stop.set()
+        self.write_thread.join()
+        self.output_file.close()
+        self.client.close()
+
+
+if __name__ == '__main__':
+    sink = JackAudioSink('recording.wav')
+    sink.start()
+    input('Recording, press enter to stop\n')
+    sink.stop()
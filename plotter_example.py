@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Live plotter example plus a small sine-data helper used to feed it.
+"""
+
+import io
+import math
+
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _multi_sine_kernel(frequencies, amplitudes, sample_rate, out):
+        # one pass over the samples with the harmonic sum kept in a scalar
+        for i in prange(out.size):
+            t = i / sample_rate
+            acc = 0.0
+            for k in range(frequencies.size):
+                acc += amplitudes[k] * math.sin(2 * math.pi * frequencies[k] * t)
+            out[i] = acc
+
+
+class SineWaveData:
+
+    def __init__(self, sample_rate=44100, duration=1.0):
+        self.sample_rate = sample_rate
+        self.duration = duration
+
+    def generate(self, frequency, amplitude=1.0, phase=0.0):
+        """Single sine wave; returns (t, wave)."""
+        n = int(self.sample_rate * self.duration)
+        t = np.arange(n) / self.sample_rate
+        wave = np.multiply(t, 2 * np.pi * frequency)
+        if phase:
+            wave += phase
+        np.sin(wave, out=wave)
+        wave *= amplitude
+        return t, wave
+
+    def generate_multiple_frequencies(self, frequencies, amplitudes=None):
+        """Sum of sine waves; returns (t, wave)."""
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        if amplitudes is None:
+            amplitudes = np.ones(len(frequencies))
+        amplitudes = np.asarray(amplitudes, dtype=np.float64)
+        n = int(self.sample_rate * self.duration)
+        t = np.arange(n) / self.sample_rate
+        if HAVE_NUMBA:
+            wave = np.empty(n)
+            _multi_sine_kernel(frequencies, amplitudes,
+                               float(self.sample_rate), wave)
+            return t, wave
+        # broadcast across harmonics: one batched sin pass, one reduction
+        wave = (amplitudes[:, None]
+                * np.sin(2 * np.pi * frequencies[:, None] * t)).sum(axis=0)
+        return t, wave
+
+
+fig = plt.figure()
+ax1 = fig.add_subplot(1, 1, 1)
+line_plot, = ax1.plot([], [])
+xs = []
+ys = []
+_offset = 0
+
+
+def animate(i):
+    """Parse only the bytes appended to example.txt since the last frame."""
+    global _offset
+    try:
+        with open('example.txt', 'rb') as f:
+            f.seek(_offset)
+            chunk = f.read()
+    except FileNotFoundError:
+        return
+    cut = chunk.rfind(b'\n')
+    if cut == -1:  # no complete new line yet
+        return
+    _offset += cut + 1
+    block = np.atleast_2d(np.genfromtxt(io.BytesIO(chunk[:cut + 1]),
+                                        delimiter=','))
+    if block.size:
+        xs.extend(block[:, 0])
+        ys.extend(block[:, 1])
+    line_plot.set_data(xs, ys)
+    ax1.relim()
+    ax1.autoscale_view()
+
+
+if __name__ == '__main__':
+    ani = animation.FuncAnimation(fig, animate, interval=1000)
+    plt.show()
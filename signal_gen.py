@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Waveform generators for the scope test signals.
+
+The time grid is computed once per (sampling_rate, duration) pair and
+shared by all of the generators, and each waveform is produced in a
+single pass over one buffer instead of a chain of temporaries.
+"""
+
+import functools
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _sine_fused(out, amplitude, dphase):
+        for i in prange(out.size):
+            out[i] = amplitude * math.sin(i * dphase)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _square_fused(out, amplitude, step):
+        for i in prange(out.size):
+            frac = (i * step) % 1.0
+            out[i] = amplitude if frac < 0.5 else -amplitude
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _triangle_fused(out, amplitude, step):
+        for i in prange(out.size):
+            x = i * step
+            x -= round(x)
+            out[i] = 4.0 * amplitude * abs(x) - amplitude
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _saw_fused(out, amplitude, step):
+        for i in prange(out.size):
+            x = i * step
+            out[i] = 2.0 * amplitude * (x - round(x))
+
+
+@functools.lru_cache(maxsize=8)
+def _grid(sampling_rate, duration):
+    """Return the shared float32 time grid for (sampling_rate, duration)."""
+    n = int(sampling_rate * duration)
+    t = np.arange(n, dtype=np.float32)
+    t *= np.float32(1.0 / sampling_rate)
+    return t
+
+
+def _int_phase(frequency, sampling_rate, duration):
+    """uint32 phase ramp: one waveform cycle per 2**32 wrap, branch-free."""
+    n = int(sampling_rate * duration)
+    step = np.uint32(round(frequency * 2.0**32 / sampling_rate))
+    return np.arange(n, dtype=np.uint32) * step
+
+
+def sin(frequency, amplitude, sampling_rate, duration):
+    """Sine wave, synthesized in one pass over a single buffer."""
+    if HAVE_NUMBA:
+        out = np.empty(int(sampling_rate * duration), dtype=np.float32)
+        _sine_fused(out, amplitude, 2 * np.pi * frequency / sampling_rate)
+        return out
+    t = _grid(sampling_rate, duration)
+    buf = np.multiply(t, np.float32(2 * np.pi * frequency))
+    np.sin(buf, out=buf)
+    buf *= np.float32(amplitude)
+    return buf
+
+
+def square(frequency, amplitude, sampling_rate, duration):
+    """Square wave from the fractional phase; no sin() pass needed."""
+    if HAVE_NUMBA:
+        out = np.empty(int(sampling_rate * duration), dtype=np.float32)
+        _square_fused(out, amplitude, frequency / sampling_rate)
+        return out
+    phase = _int_phase(frequency, sampling_rate, duration)
+    # high bit selects the half cycle: 0 -> +amplitude, 1 -> -amplitude
+    return ((phase >> np.uint32(31)).astype(np.float32) * -2.0 + 1.0) * amplitude
+
+
+def triangle(frequency, amplitude, sampling_rate, duration):
+    """Triangle wave built from the wrapped phase."""
+    if HAVE_NUMBA:
+        out = np.empty(int(sampling_rate * duration), dtype=np.float32)
+        _triangle_fused(out, amplitude, frequency / sampling_rate)
+        return out
+    phase = _int_phase(frequency, sampling_rate, duration)
+    # fold the ramp in unsigned space: min(phase, ~phase) rises to
+    # 2**31 - 1 and falls back, with no abs(INT32_MIN) overflow
+    buf = np.minimum(phase, ~phase).astype(np.float32)
+    buf *= 2 * amplitude / 2.0**31
+    buf -= amplitude
+    return buf
+
+
+def Saw(frequency, amplitude, sampling_rate, duration):
+    """Sawtooth wave built from the wrapped phase."""
+    if HAVE_NUMBA:
+        out = np.empty(int(sampling_rate * duration), dtype=np.float32)
+        _saw_fused(out, amplitude, frequency / sampling_rate)
+        return out
+    phase = _int_phase(frequency, sampling_rate, duration)
+    buf = phase.view(np.int32).astype(np.float32)
+    buf *= amplitude / 2.0**31
+    return buf
+
+
+def to_int16(wave):
+    """Quantize a float waveform to int16 in one fused multiply-cast."""
+    return (wave * np.float32(32767)).astype(np.int16)
+
+
+def write_wav(path, wave, sampling_rate):
+    """Write a float waveform straight to a 16-bit WAV file."""
+    from scipy.io import wavfile  # only needed for file output
+    wavfile.write(path, int(sampling_rate), to_int16(wave))
+
+
+if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+
+    for wave in (sin, square, triangle, Saw):
+        plt.plot(_grid(1000, 0.01), wave(440, 1.0, 1000, 0.01), label=wave.__name__)
+    plt.legend()
+    plt.show()
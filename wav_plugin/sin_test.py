@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+Generates sine test waves with different kinds of frequency modulation
+and saves them as WAV files for the scope to chew on.
+"""
+
+import math
+
+import numpy as np
+import matplotlib.pyplot as plt
+import scipy.fft
+from scipy import signal
+from scipy.io import wavfile
+
+try:
+    from scipy.ndimage import gaussian_filter1d
+except ImportError:
+    gaussian_filter1d = None
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(fastmath=True, cache=True)
+    def _ultra_smooth_kernel(n, sample_rate, duration, center_freq,
+                             freq_dev, amplitude, wave, inst_freq):
+        # builds the frequency wobble, integrates the phase and writes
+        # the wave in one pass -- the carried phase keeps the loop serial
+        phase = 0.0
+        for i in range(n):
+            t = i / sample_rate
+            wobble = (math.sin(2 * math.pi * 0.5 * t)
+                      + 0.5 * math.sin(2 * math.pi * 1.3 * t)
+                      + 0.25 * math.sin(2 * math.pi * 2.1 * t))
+            envelope = 0.5 * (1 - math.cos(2 * math.pi * t / duration))
+            f = center_freq + freq_dev * envelope * wobble / 1.75
+            inst_freq[i] = f
+            phase += 2 * math.pi * f / sample_rate
+            wave[i] = amplitude * math.sin(phase)
+
+    @njit(fastmath=True, cache=True)
+    def _integrate_phase_kernel(inst_freq, sample_rate, amplitude, wave):
+        phase = 0.0
+        for i in range(inst_freq.size):
+            phase += 2 * math.pi * inst_freq[i] / sample_rate
+            wave[i] = amplitude * math.sin(phase)
+
+
+def sine_into(out, t, freq, amplitude):
+    """amplitude * sin(2*pi*freq*t) computed in place in ``out``."""
+    np.multiply(t, 2 * np.pi * freq, out=out)
+    np.sin(out, out=out)
+    np.multiply(out, amplitude, out=out)
+    return out
+
+
+class SineWaveGenerator:
+
+    def __init__(self, sample_rate=160000, duration=5.0, amplitude=0.8):
+        self.sample_rate = sample_rate
+        self.duration = duration
+        self.amplitude = amplitude
+
+    def _time(self):
+        n = int(self.sample_rate * self.duration)
+        return np.arange(n, dtype=np.float32) * np.float32(1.0 / self.sample_rate)
+
+    def _time64(self):
+        """float64 axis for phase math, where 2*pi*f*t reaches ~1e6 rad
+        and a float32 ulp is a sizeable fraction of a cycle."""
+        n = int(self.sample_rate * self.duration)
+        return np.arange(n) / self.sample_rate
+
+    def _wave_from_freq(self, instantaneous_freq):
+        """Integrate a frequency track into a sine wave."""
+        if HAVE_NUMBA:
+            wave = np.empty(instantaneous_freq.size)
+            _integrate_phase_kernel(
+                np.ascontiguousarray(instantaneous_freq, dtype=np.float64),
+                float(self.sample_rate), self.amplitude, wave)
+            return wave.astype(np.float32)
+        # accumulate in float64: the running sum dwarfs a float32 ulp
+        # long before the end of a multi-second wave
+        phase = 2 * np.pi * np.cumsum(instantaneous_freq,
+                                      dtype=np.float64) / self.sample_rate
+        np.sin(phase, out=phase)
+        phase *= self.amplitude
+        return phase.astype(np.float32)
+
+    def generate_clean_wave(self, center_freq=28000):
+        """Constant-frequency sine wave."""
+        t = self._time()
+        # phase in float64; only the finished wave drops to float32
+        wave = sine_into(np.empty(len(t)), self._time64(), center_freq,
+                         self.amplitude).astype(np.float32)
+        # constant track: keep one value, not len(t) copies of it
+        instantaneous_freq = np.array([float(center_freq)])
+        return t, wave, instantaneous_freq
+
+    def generate_swept_wave(self, freq_start=20000, freq_end=36000,
+                            sweep_type='linear'):
+        """Frequency sweep with an analytically integrated phase.
+
+        The phase for the linear and cosine laws is closed-form, so no
+        cumsum pass (a serial dependency chain) is needed; only the
+        tanh S-curve sweep falls back to numerical integration.
+        """
+        t = self._time()
+        T = self.duration
+        df = freq_end - freq_start
+        if sweep_type == 'linear':
+            instantaneous_freq = freq_start + df * t / T
+            # scipy's chirp carries the closed-form phase in C; phi=-90
+            # keeps the sine convention of the other sweep branches, and
+            # the float64 axis keeps the phase below the noise floor
+            wave = (self.amplitude
+                    * signal.chirp(self._time64(), f0=freq_start,
+                                   f1=freq_end, t1=T, method='linear',
+                                   phi=-90)).astype(np.float32)
+            return t, wave, instantaneous_freq
+        elif sweep_type == 'cosine':
+            instantaneous_freq = freq_start + df * (1 - np.cos(np.pi * t / T)) / 2
+            # integral of (1 - cos(pi*t/T))/2 is t/2 - T*sin(pi*t/T)/(2*pi),
+            # evaluated on the float64 axis for phase accuracy
+            t64 = self._time64()
+            phase = 2 * np.pi * (freq_start * t64
+                                 + df * (t64 / 2 - T * np.sin(np.pi * t64 / T)
+                                         / (2 * np.pi)))
+        elif sweep_type == 'smooth':
+            instantaneous_freq = freq_start + df * 0.5 * (
+                1 + np.tanh(6 * (t / T - 0.5)))
+            return t, self._wave_from_freq(instantaneous_freq), \
+                instantaneous_freq
+        else:
+            raise ValueError('unknown sweep_type: %r' % (sweep_type,))
+        np.sin(phase, out=phase)
+        phase *= self.amplitude
+        return t, phase.astype(np.float32), instantaneous_freq
+
+    def generate_ultra_smooth_wave(self, center_freq=28000, freq_dev=8000):
+        """Slow multi-sine frequency wobble around the center frequency."""
+        t = self._time()
+        if HAVE_NUMBA:
+            n = len(t)
+            wave = np.empty(n)
+            instantaneous_freq = np.empty(n)
+            _ultra_smooth_kernel(n, float(self.sample_rate), self.duration,
+                                 float(center_freq), float(freq_dev),
+                                 self.amplitude, wave, instantaneous_freq)
+            return t, wave.astype(np.float32), instantaneous_freq
+        freq_var1 = np.sin(2 * np.pi * 0.5 * t)
+        freq_var2 = 0.5 * np.sin(2 * np.pi * 1.3 * t)
+        freq_var3 = 0.25 * np.sin(2 * np.pi * 2.1 * t)
+        envelope = 0.5 * (1 - np.cos(2 * np.pi * t / self.duration))
+        instantaneous_freq = center_freq + freq_dev * envelope * (
+            freq_var1 + freq_var2 + freq_var3) / 1.75
+        return t, self._wave_from_freq(instantaneous_freq), instantaneous_freq
+
+    def generate_gaussian_smooth_wave(self, center_freq=28000, freq_dev=8000,
+                                      smoothness=50):
+        """Random frequency walk smoothed with a Gaussian filter."""
+        t = self._time()
+        n = len(t)
+        rng = np.random.default_rng(0)
+        control = rng.uniform(-1, 1, max(n // (smoothness * 100), 16))
+        freq_variations = np.interp(np.linspace(0, 1, n),
+                                    np.linspace(0, 1, len(control)), control)
+        if gaussian_filter1d is not None:
+            # one separable Gaussian pass does all of the smoothing
+            freq_variations = gaussian_filter1d(freq_variations,
+                                                sigma=smoothness)
+        else:
+            # three passes of [0.25, 0.5, 0.25] collapse into one 7-tap
+            # binomial kernel
+            kernel = np.array([1, 6, 15, 20, 15, 6, 1]) / 64.0
+            freq_variations = np.convolve(freq_variations, kernel,
+                                          mode='same')
+            # O(N) running mean via cumulative sums instead of an
+            # O(N*W) convolution with a sample_rate/20-tap box
+            window_size = int(self.sample_rate * 0.05)
+            half = window_size // 2
+            c = np.concatenate(([0.0], np.cumsum(freq_variations)))
+            hi = np.minimum(np.arange(n) + half + 1, n)
+            lo = np.maximum(np.arange(n) - half, 0)
+            freq_variations = (c[hi] - c[lo]) / (hi - lo)
+        instantaneous_freq = center_freq + freq_dev * freq_variations
+        return t, self._wave_from_freq(instantaneous_freq), instantaneous_freq
+
+    def save_wave(self, filename, wave):
+        """Write the wave as a 16-bit WAV file."""
+        wave_normalized = (np.asarray(wave, dtype=np.float32)
+                           * np.float32(32767)).astype(np.int16)
+        wavfile.write(filename, self.sample_rate, wave_normalized)
+
+    def plot_wave(self, t, wave, instantaneous_freq, title='wave'):
+        """Plot the waveform, its frequency track and its spectrum."""
+        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 8))
+        ax1.plot(t[:2000], wave[:2000])
+        ax1.set_title(title)
+        ax1.set_xlabel('time [s]')
+        instantaneous_freq = np.atleast_1d(instantaneous_freq)
+        if instantaneous_freq.size > 1:
+            ax2.plot(t, instantaneous_freq)
+        else:
+            ax2.axhline(float(instantaneous_freq[0]))
+        ax2.set_xlabel('time [s]')
+        ax2.set_ylabel('frequency [Hz]')
+        print('freq mean %.1f min %.1f max %.1f'
+              % (np.mean(instantaneous_freq), np.min(instantaneous_freq),
+                 np.max(instantaneous_freq)))
+        # real FFT: only the non-redundant half, at a fast transform size
+        n_fft = scipy.fft.next_fast_len(len(wave), real=True)
+        spectrum = scipy.fft.rfft(wave, n=n_fft)
+        freqs = np.fft.rfftfreq(n_fft, 1 / self.sample_rate)
+        ax3.plot(freqs, np.abs(spectrum))
+        ax3.set_xlabel('frequency [Hz]')
+        fig.tight_layout()
+        plt.show()
+
+
+if __name__ == '__main__':
+    gen = SineWaveGenerator()
+    t, wave, inst = gen.generate_swept_wave(sweep_type='linear')
+    gen.save_wave('sweep.wav', wave)
+    gen.plot_wave(t, wave, inst, title='linear sweep')
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Builds a test clip out of appended waveform segments and saves it as a
+16-bit mono WAV file.
+
+The clip is kept as a list of NumPy segments -- appending is one
+pointer push and the samples are only joined once at save time.
+"""
+
+import wave
+
+import numpy as np
+
+audio = []  # list of float32 segment arrays
+sample_rate = 44100.0
+
+
+def append_silence(duration_milliseconds=500):
+    """Add silence to the clip."""
+    num_samples = int(sample_rate * (duration_milliseconds / 1000.0))
+    audio.append(np.zeros(num_samples, dtype=np.float32))
+
+
+def _time_grid(duration_milliseconds):
+    """Float32 time axis in seconds; the ms value is converted exactly once."""
+    duration_s = duration_milliseconds / 1000.0
+    n = int(sample_rate * duration_s)
+    return np.arange(n, dtype=np.float32) / np.float32(sample_rate)
+
+
+def append_sinewave(freq=440.0, duration_milliseconds=500, volume=1.0):
+    """Add a sine segment, computed as one vectorized array."""
+    t = _time_grid(duration_milliseconds)
+    sine_wave = volume * np.sin(2 * np.pi * freq * t)
+    audio.append(sine_wave.astype(np.float32, copy=False))
+
+
+def append_triangle(freq=440.0, duration_milliseconds=500, volume=1.0):
+    """Add a triangle segment, computed as one vectorized array."""
+    t = _time_grid(duration_milliseconds)
+    frac = (freq * t) % 1.0
+    triangle_wave = volume * (2 * np.abs(2 * frac - 1) - 1)
+    audio.append(triangle_wave.astype(np.float32, copy=False))
+
+
+def append_square(freq=440.0, duration_milliseconds=500, volume=1.0):
+    """Add a square segment, derived from the wrapped phase."""
+    t = _time_grid(duration_milliseconds)
+    frac = (freq * t) % 1.0
+    square_wave = volume * np.where(frac < 0.5, 1.0, -1.0)
+    audio.append(square_wave.astype(np.float32, copy=False))
+
+
+def append_saw(freq=440.0, duration_milliseconds=500, volume=1.0):
+    """Add a sawtooth segment, derived from the wrapped phase."""
+    t = _time_grid(duration_milliseconds)
+    saw_wave = volume * (2 * ((freq * t) % 1.0) - 1)
+    audio.append(saw_wave.astype(np.float32, copy=False))
+
+
+def save_wav(file_name):
+    """Write the accumulated clip to a 16-bit mono WAV file."""
+    full = (np.concatenate(audio) if audio
+            else np.zeros(0, dtype=np.float32))
+    wav_file = wave.open(file_name, 'w')
+    wav_file.setparams((1, 2, int(sample_rate), len(full),
+                        'NONE', 'not compressed'))
+    wav_file.writeframes((full * np.float32(32767)).astype('<i2').tobytes())
+    wav_file.close()
+
+
+if __name__ == '__main__':
+    append_sinewave(volume=0.25)
+    append_silence()
+    append_sinewave(volume=0.5)
+    append_silence()
+    append_triangle(volume=0.5)
+    save_wav('output.wav')
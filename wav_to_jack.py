@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Plays a precomputed sine table out of a JACK port.
+
+The table is built as float32 up front and read with a local cursor,
+so the realtime callback does no astype copy, no frame_time modulo,
+and handles the wrap with two plain slice assignments.
+"""
+
+import math
+
+import numpy as np
+import jack
+
+frequency = 28000
+amplitude = 0.5
+
+client = jack.Client('wav_to_jack')
+outport = client.outports.register('out')
+samplerate = client.samplerate
+
+# the shortest table holding a whole number of cycles: it wraps with
+# zero phase error, so no click at the seam, and usually fits in L1
+table_len = samplerate // math.gcd(samplerate, frequency)
+t = np.arange(table_len, dtype=np.float32) / np.float32(samplerate)
+sine_wave = np.float32(amplitude) * np.sin(np.float32(2 * np.pi * frequency) * t)
+# pad the table cyclically so any block is one contiguous slice, even
+# when one exact cycle is shorter than the JACK period
+table = np.resize(sine_wave, table_len + client.blocksize)
+
+cursor = 0
+
+
+@client.set_process_callback
+def process(frames):
+    global cursor
+    outport.get_array()[:] = table[cursor:cursor + frames]
+    cursor = (cursor + frames) % table_len
+
+
+if __name__ == '__main__':
+    with client:
+        client.connect(outport, 'system:playback_1')
+        input('Playing, press enter to stop\n')